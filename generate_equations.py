@@ -6,16 +6,212 @@ Generates two stylish PDFs: one with equations, one with answers
 
 import random
 import math
-from fractions import Fraction
+import re
+import functools
+from itertools import accumulate
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from reportlab.lib.pagesizes import letter
 from reportlab.lib import colors
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.pdfgen import canvas
 
+# Perfect squares and their roots, index-aligned
+_PERFECT_SQUARES = (1, 4, 9, 16, 25, 36, 49, 64, 81, 100, 121, 144, 169, 196, 225)
+_ROOTS = tuple(range(1, len(_PERFECT_SQUARES) + 1))
+
+# Powers of ten for scientific notation
+_POW10 = tuple(10 ** i for i in range(20))
+
+# Fixed choice pools used by the generators
+_SMALL_DENOMINATORS = (2, 3, 4, 5)
+_SMALLER_DENOMINATORS = _SMALL_DENOMINATORS[:3]
+_TRAVEL_HOURS = (2, 4, 5, 10)
+_FRIENDLY_PERCENTS = (10, 20, 25, 50, 75)
+_INTEREST_RATES = (2, 3, 4, 5, 6, 7, 8)
+
+# Use Pythagorean triples for cleaner answers
+_PYTHAGOREAN_TRIPLES = ((3, 4, 5), (5, 12, 13), (8, 15, 17), (7, 24, 25))
+_EASY_PYTHAGOREAN_TRIPLES = _PYTHAGOREAN_TRIPLES[:2]
+
+# Ready-made (equation, answer) Pythagorean problems by difficulty
+_PYTHAGOREAN_PROBLEMS = {
+    1: tuple((f"Find c: a = {a}, b = {b} (a² + b² = c²)", str(c))
+             for a, b, c in _EASY_PYTHAGOREAN_TRIPLES),
+    2: tuple((f"Find hypotenuse: legs are {a} and {b}", str(c))
+             for a, b, c in _PYTHAGOREAN_TRIPLES),
+    3: tuple((f"Find leg: hypotenuse = {c}, other leg = {a}", str(b))
+             for a, b, c in _PYTHAGOREAN_TRIPLES),
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_expr(expr):
+    """Compile an equation expression once per distinct string"""
+    return compile(expr.replace('^', '**'), '<eq>', 'eval')
+
+
+def _format_cents(cents):
+    """Format a whole number of hundredths as a decimal string"""
+    sign = '-' if cents < 0 else ''
+    whole, rem = divmod(abs(cents), 100)
+    return f"{sign}{whole}.{rem:02d}"
+
+
+# Progression stages: each covers an equation range and lists the generator
+# kinds (EquationGenerator.generate_<kind>) with their difficulty choices
+STAGES = [
+    # Stage 1: Basic arithmetic (equations 1-500)
+    {
+        'range': (0, 500),
+        'generators': [
+            ('addition_subtraction', [1, 1, 2]),
+            ('multiplication_division', [1, 1, 2]),
+            ('pemdas', [1, 1, 1]),
+            ('absolute_value', [1, 1, 1]),
+        ]
+    },
+    # Stage 2: More arithmetic + square roots (equations 501-1200)
+    {
+        'range': (500, 1200),
+        'generators': [
+            ('addition_subtraction', [2, 3, 3]),
+            ('multiplication_division', [2, 3, 3]),
+            ('pemdas', [2, 2, 2]),
+            ('square_roots', [1, 1, 2]),
+        ]
+    },
+    # Stage 3: Fractions introduction (equations 1201-2000)
+    {
+        'range': (1200, 2000),
+        'generators': [
+            ('pemdas', [3, 3, 3]),
+            ('square_roots', [2, 2, 3]),
+            ('fraction_addition', [1, 1, 1]),
+            ('fraction_multiplication', [1, 1, 1]),
+            ('decimal_operations', [1, 1, 2]),
+        ]
+    },
+    # Stage 4: Advanced fractions + decimals (equations 2001-3000)
+    {
+        'range': (2000, 3000),
+        'generators': [
+            ('fraction_addition', [2, 2, 3]),
+            ('fraction_multiplication', [2, 2, 3]),
+            ('decimal_operations', [2, 3, 3]),
+        ]
+    },
+    # Stage 5: Expressions and evaluation (equations 3001-4000)
+    {
+        'range': (3000, 4000),
+        'generators': [
+            ('evaluate_expression', [1, 1, 2]),
+            ('distributive_property', [1, 1, 2]),
+            ('combine_like_terms', [1, 1, 2]),
+        ]
+    },
+    # Stage 6: Advanced expressions (equations 4001-4800)
+    {
+        'range': (4000, 4800),
+        'generators': [
+            ('evaluate_expression', [2, 2, 3]),
+            ('distributive_property', [2, 2, 3]),
+            ('combine_like_terms', [2, 2, 3]),
+        ]
+    },
+    # Stage 7: One-step equations (equations 4801-5600)
+    {
+        'range': (4800, 5600),
+        'generators': [
+            ('one_step_addition', [1, 2, 2]),
+            ('one_step_multiplication', [1, 2, 2]),
+        ]
+    },
+    # Stage 8: Two-step equations (equations 5601-6500)
+    {
+        'range': (5600, 6500),
+        'generators': [
+            ('one_step_addition', [3, 3, 3]),
+            ('one_step_multiplication', [3, 3, 3]),
+            ('two_step_equation', [1, 1, 2]),
+        ]
+    },
+    # Stage 9: Variables on both sides (equations 6501-7200)
+    {
+        'range': (6500, 7200),
+        'generators': [
+            ('two_step_equation', [2, 3, 3]),
+            ('variables_both_sides', [1, 1, 2]),
+        ]
+    },
+    # Stage 10: Distribution in equations (equations 7201-7800)
+    {
+        'range': (7200, 7800),
+        'generators': [
+            ('variables_both_sides', [2, 2, 3]),
+            ('distributive_equation', [1, 2, 2]),
+            ('fraction_equation', [1, 1, 1]),
+        ]
+    },
+    # Stage 11: Ratios and proportions (equations 7801-8400)
+    {
+        'range': (7800, 8400),
+        'generators': [
+            ('distributive_equation', [3, 3, 3]),
+            ('fraction_equation', [2, 2, 3]),
+            ('ratio', [1, 2, 2]),
+            ('proportion', [1, 2, 2]),
+            ('percent', [1, 2, 2]),
+        ]
+    },
+    # Stage 12: Exponents (equations 8401-9000)
+    {
+        'range': (8400, 9000),
+        'generators': [
+            ('simple_interest', [1, 2, 3]),
+            ('exponent_basic', [1, 2, 3]),
+            ('exponent_properties', [1, 2, 2]),
+            ('negative_exponents', [1, 2, 3]),
+            ('scientific_notation', [1, 1, 2]),
+        ]
+    },
+    # Stage 13: Linear functions (equations 9001-9500)
+    {
+        'range': (9000, 9500),
+        'generators': [
+            ('scientific_notation', [2, 3, 3]),
+            ('coordinate_plane', [1, 2, 3]),
+            ('slope', [1, 2, 3]),
+            ('linear_equation', [1, 2, 3]),
+        ]
+    },
+    # Stage 14: Geometry (equations 9501-9800)
+    {
+        'range': (9500, 9800),
+        'generators': [
+            ('angle_relationships', [1, 2, 3]),
+            ('perimeter_area', [1, 2, 3]),
+            ('circle_problems', [1, 2, 3]),
+            ('pythagorean', [1, 2, 3]),
+            ('volume', [1, 2, 3]),
+        ]
+    },
+    # Stage 15: Final mixed review (equations 9801-10000)
+    {
+        'range': (9800, 10000),
+        'generators': [
+            ('mean_median', [1, 2, 3]),
+            ('probability', [1, 2, 3]),
+            ('variables_both_sides', [3, 3, 3]),
+            ('distributive_equation', [3, 3, 3]),
+            ('linear_equation', [3, 3, 3]),
+            ('pythagorean', [3, 3, 3]),
+        ]
+    },
+]
+
 
 class EquationGenerator:
     """Generates progressively challenging equations based on pre-algebra syllabus"""
@@ -23,58 +219,65 @@ class EquationGenerator:
     def __init__(self, seed=None):
         """Initialize with optional seed for reproducibility"""
         if seed is None:
-            seed = random.randint(0, 1000000)
-        random.seed(seed)
+            # Draw from os.urandom so the default seed doesn't consume or
+            # depend on the global random state (a caller's random.seed(x)
+            # would otherwise give every EquationGenerator() the same seed)
+            seed = random.SystemRandom().randint(0, 1000000)
         self.seed = seed
+        self.rng = random.Random(seed)
         self.equations = []
         self.answers = []
 
     def gcd(self, a, b):
         """Greatest common divisor"""
-        while b:
-            a, b = b, a % b
-        return a
+        return math.gcd(a, b)
 
     def simplify_fraction(self, num, den):
         """Simplify a fraction"""
         if den == 0:
             return num, 1
-        g = self.gcd(abs(num), abs(den))
+        g = math.gcd(num, den)
         return num // g, den // g
 
-    def format_fraction(self, num, den):
-        """Format fraction as string"""
-        num, den = self.simplify_fraction(num, den)
-        if den == 1:
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def format_fraction(num, den):
+        """Format fraction as string (cached; inputs are small ints)"""
+        if den == 0 or den == 1:
             return str(num)
-        if den == -1:
-            return str(-num)
         if den < 0:
             num, den = -num, -den
+        # Most random fractions are already in lowest terms
+        g = math.gcd(num, den)
+        if g != 1:
+            num //= g
+            den //= g
+        if den == 1:
+            return str(num)
         return f"{num}/{den}"
 
     def eval_equation(self, expr, x_val):
         """Safely evaluate equation with given x value"""
-        return eval(expr.replace('x', str(x_val)))
+        return eval(_compile_expr(expr), {'__builtins__': {}}, {'x': x_val})
 
     # ===== UNIT 1: FUNDAMENTALS OF REAL NUMBERS =====
 
     def generate_addition_subtraction(self, difficulty):
         """Basic addition and subtraction of integers"""
         if difficulty <= 1:
-            a = random.randint(1, 20)
-            b = random.randint(1, 20)
+            a = self.rng.randint(1, 20)
+            b = self.rng.randint(1, 20)
             eq = f"{a} + {b}"
             ans = a + b
         elif difficulty == 2:
-            a = random.randint(-20, 20)
-            b = random.randint(1, 20)
+            a = self.rng.randint(-20, 20)
+            b = self.rng.randint(1, 20)
             eq = f"{a} + {b}"
             ans = a + b
         else:
-            a = random.randint(-50, 50)
-            b = random.randint(-50, 50)
-            c = random.randint(-50, 50)
+            a = self.rng.randint(-50, 50)
+            b = self.rng.randint(-50, 50)
+            c = self.rng.randint(-50, 50)
             eq = f"{a} + {b} - {c}"
             ans = a + b - c
 
@@ -83,21 +286,21 @@ class EquationGenerator:
     def generate_multiplication_division(self, difficulty):
         """Basic multiplication and division of integers"""
         if difficulty <= 1:
-            a = random.randint(2, 12)
-            b = random.randint(2, 12)
+            a = self.rng.randint(2, 12)
+            b = self.rng.randint(2, 12)
             eq = f"{a} × {b}"
             ans = a * b
         elif difficulty == 2:
-            a = random.randint(2, 12)
-            b = random.randint(2, 12)
+            a = self.rng.randint(2, 12)
+            b = self.rng.randint(2, 12)
             result = a * b
             eq = f"{result} ÷ {a}"
             ans = b
         else:
-            a = random.randint(-12, 12)
-            b = random.randint(-12, 12)
+            a = self.rng.randint(-12, 12)
+            b = self.rng.randint(-12, 12)
             if b == 0:
-                b = random.randint(1, 12)
+                b = self.rng.randint(1, 12)
             eq = f"{a} × {b}"
             ans = a * b
 
@@ -106,41 +309,41 @@ class EquationGenerator:
     def generate_pemdas(self, difficulty):
         """Order of operations problems"""
         if difficulty <= 1:
-            a = random.randint(1, 10)
-            b = random.randint(1, 10)
-            c = random.randint(1, 10)
+            a = self.rng.randint(1, 10)
+            b = self.rng.randint(1, 10)
+            c = self.rng.randint(1, 10)
             eq = f"{a} + {b} × {c}"
             ans = a + b * c
         elif difficulty == 2:
-            a = random.randint(1, 10)
-            b = random.randint(1, 10)
-            c = random.randint(1, 10)
+            a = self.rng.randint(1, 10)
+            b = self.rng.randint(1, 10)
+            c = self.rng.randint(1, 10)
             eq = f"({a} + {b}) × {c}"
             ans = (a + b) * c
         else:
-            a = random.randint(2, 10)
-            b = random.randint(1, 10)
-            c = random.randint(1, 5)
-            d = random.randint(1, 10)
+            a = self.rng.randint(2, 10)
+            b = self.rng.randint(1, 10)
+            c = self.rng.randint(1, 5)
+            d = self.rng.randint(1, 10)
             eq = f"{a}² + {b} × {c} - {d}"
-            ans = a**2 + b * c - d
+            ans = a * a + b * c - d
 
         return eq, str(ans)
 
     def generate_absolute_value(self, difficulty):
         """Absolute value problems"""
         if difficulty <= 1:
-            a = random.randint(-20, 20)
+            a = self.rng.randint(-20, 20)
             eq = f"|{a}|"
             ans = abs(a)
         elif difficulty == 2:
-            a = random.randint(-20, 20)
-            b = random.randint(-20, 20)
+            a = self.rng.randint(-20, 20)
+            b = self.rng.randint(-20, 20)
             eq = f"|{a}| + |{b}|"
             ans = abs(a) + abs(b)
         else:
-            a = random.randint(-20, 20)
-            b = random.randint(-20, 20)
+            a = self.rng.randint(-20, 20)
+            b = self.rng.randint(-20, 20)
             eq = f"|{a} - {b}|"
             ans = abs(a - b)
 
@@ -148,21 +351,19 @@ class EquationGenerator:
 
     def generate_square_roots(self, difficulty):
         """Square root problems"""
-        perfect_squares = [1, 4, 9, 16, 25, 36, 49, 64, 81, 100, 121, 144, 169, 196, 225]
-
         if difficulty <= 1:
-            sq = random.choice(perfect_squares[:9])
-            eq = f"√{sq}"
-            ans = int(math.sqrt(sq))
+            i = self.rng.randrange(9)
+            eq = f"√{_PERFECT_SQUARES[i]}"
+            ans = _ROOTS[i]
         elif difficulty == 2:
-            sq = random.choice(perfect_squares)
-            eq = f"√{sq}"
-            ans = int(math.sqrt(sq))
+            i = self.rng.randrange(len(_PERFECT_SQUARES))
+            eq = f"√{_PERFECT_SQUARES[i]}"
+            ans = _ROOTS[i]
         else:
-            sq1 = random.choice(perfect_squares[:9])
-            sq2 = random.choice(perfect_squares[:9])
-            eq = f"√{sq1} + √{sq2}"
-            ans = int(math.sqrt(sq1) + math.sqrt(sq2))
+            i = self.rng.randrange(9)
+            j = self.rng.randrange(9)
+            eq = f"√{_PERFECT_SQUARES[i]} + √{_PERFECT_SQUARES[j]}"
+            ans = _ROOTS[i] + _ROOTS[j]
 
         return eq, str(ans)
 
@@ -172,30 +373,30 @@ class EquationGenerator:
         """Adding fractions"""
         if difficulty <= 1:
             # Like denominators
-            den = random.randint(2, 12)
-            num1 = random.randint(1, 10)
-            num2 = random.randint(1, 10)
+            den = self.rng.randint(2, 12)
+            num1 = self.rng.randint(1, 10)
+            num2 = self.rng.randint(1, 10)
             eq = f"{num1}/{den} + {num2}/{den}"
             ans = self.format_fraction(num1 + num2, den)
         elif difficulty == 2:
             # Unlike denominators (one is multiple of other)
-            den1 = random.choice([2, 3, 4, 5])
-            den2 = den1 * random.randint(2, 3)
-            num1 = random.randint(1, 5)
-            num2 = random.randint(1, 8)
+            den1 = self.rng.choice(_SMALL_DENOMINATORS)
+            den2 = den1 * self.rng.randint(2, 3)
+            num1 = self.rng.randint(1, 5)
+            num2 = self.rng.randint(1, 8)
             eq = f"{num1}/{den1} + {num2}/{den2}"
             # Find common denominator
-            lcm = (den1 * den2) // self.gcd(den1, den2)
+            lcm = math.lcm(den1, den2)
             result_num = num1 * (lcm // den1) + num2 * (lcm // den2)
             ans = self.format_fraction(result_num, lcm)
         else:
             # Any unlike denominators
-            den1 = random.randint(2, 8)
-            den2 = random.randint(2, 8)
-            num1 = random.randint(1, 10)
-            num2 = random.randint(1, 10)
+            den1 = self.rng.randint(2, 8)
+            den2 = self.rng.randint(2, 8)
+            num1 = self.rng.randint(1, 10)
+            num2 = self.rng.randint(1, 10)
             eq = f"{num1}/{den1} + {num2}/{den2}"
-            lcm = (den1 * den2) // self.gcd(den1, den2)
+            lcm = math.lcm(den1, den2)
             result_num = num1 * (lcm // den1) + num2 * (lcm // den2)
             ans = self.format_fraction(result_num, lcm)
 
@@ -204,25 +405,25 @@ class EquationGenerator:
     def generate_fraction_multiplication(self, difficulty):
         """Multiplying fractions"""
         if difficulty <= 1:
-            num1 = random.randint(1, 6)
-            den1 = random.randint(2, 8)
-            num2 = random.randint(1, 6)
-            den2 = random.randint(2, 8)
+            num1 = self.rng.randint(1, 6)
+            den1 = self.rng.randint(2, 8)
+            num2 = self.rng.randint(1, 6)
+            den2 = self.rng.randint(2, 8)
             eq = f"{num1}/{den1} × {num2}/{den2}"
             ans = self.format_fraction(num1 * num2, den1 * den2)
         elif difficulty == 2:
-            num1 = random.randint(1, 12)
-            den1 = random.randint(2, 12)
-            num2 = random.randint(-12, 12)
-            den2 = random.randint(2, 12)
+            num1 = self.rng.randint(1, 12)
+            den1 = self.rng.randint(2, 12)
+            num2 = self.rng.randint(-12, 12)
+            den2 = self.rng.randint(2, 12)
             eq = f"{num1}/{den1} × {num2}/{den2}"
             ans = self.format_fraction(num1 * num2, den1 * den2)
         else:
             # Division
-            num1 = random.randint(1, 10)
-            den1 = random.randint(2, 10)
-            num2 = random.randint(1, 10)
-            den2 = random.randint(2, 10)
+            num1 = self.rng.randint(1, 10)
+            den1 = self.rng.randint(2, 10)
+            num2 = self.rng.randint(1, 10)
+            den2 = self.rng.randint(2, 10)
             eq = f"{num1}/{den1} ÷ {num2}/{den2}"
             ans = self.format_fraction(num1 * den2, den1 * num2)
 
@@ -230,69 +431,70 @@ class EquationGenerator:
 
     def generate_decimal_operations(self, difficulty):
         """Decimal operations"""
+        # Operands are drawn as whole cents so answers stay exact
         if difficulty <= 1:
-            a = round(random.uniform(0.1, 10), 2)
-            b = round(random.uniform(0.1, 10), 2)
-            eq = f"{a} + {b}"
-            ans = round(a + b, 2)
+            a = self.rng.randint(10, 1000)
+            b = self.rng.randint(10, 1000)
+            eq = f"{_format_cents(a)} + {_format_cents(b)}"
+            ans = a + b
         elif difficulty == 2:
-            a = round(random.uniform(0.1, 100), 2)
-            b = round(random.uniform(0.1, 100), 2)
-            eq = f"{a} - {b}"
-            ans = round(a - b, 2)
+            a = self.rng.randint(10, 10000)
+            b = self.rng.randint(10, 10000)
+            eq = f"{_format_cents(a)} - {_format_cents(b)}"
+            ans = a - b
         else:
-            a = round(random.uniform(0.1, 10), 2)
-            b = round(random.uniform(0.1, 10), 2)
-            eq = f"{a} × {b}"
-            ans = round(a * b, 2)
+            a = self.rng.randint(10, 1000)
+            b = self.rng.randint(10, 1000)
+            eq = f"{_format_cents(a)} × {_format_cents(b)}"
+            # Product is in ten-thousandths; round half up to cents
+            ans = (a * b + 50) // 100
 
-        return eq, str(ans)
+        return eq, _format_cents(ans)
 
     # ===== UNIT 3: EXPRESSIONS AND PROPERTIES =====
 
     def generate_evaluate_expression(self, difficulty):
         """Evaluate algebraic expressions"""
-        x_val = random.randint(1, 10)
+        x_val = self.rng.randint(1, 10)
 
         if difficulty <= 1:
-            a = random.randint(1, 10)
-            b = random.randint(1, 10)
+            a = self.rng.randint(1, 10)
+            b = self.rng.randint(1, 10)
             eq = f"Evaluate: {a}x + {b} when x = {x_val}"
             ans = a * x_val + b
         elif difficulty == 2:
-            a = random.randint(1, 10)
-            b = random.randint(1, 10)
-            c = random.randint(1, 10)
+            a = self.rng.randint(1, 10)
+            b = self.rng.randint(1, 10)
+            c = self.rng.randint(1, 10)
             eq = f"Evaluate: {a}x² + {b}x + {c} when x = {x_val}"
-            ans = a * x_val**2 + b * x_val + c
+            # Horner form of a*x² + b*x + c
+            ans = (a * x_val + b) * x_val + c
         else:
-            a = random.randint(-10, 10)
-            b = random.randint(-10, 10)
+            a = self.rng.randint(-10, 10)
+            b = self.rng.randint(-10, 10)
             eq = f"Evaluate: {a}x² - {b}x when x = {x_val}"
-            ans = a * x_val**2 - b * x_val
+            ans = (a * x_val - b) * x_val
 
         return eq, str(ans)
 
     def generate_distributive_property(self, difficulty):
         """Distributive property simplification"""
         if difficulty <= 1:
-            a = random.randint(2, 8)
-            b = random.randint(1, 10)
-            c = random.randint(1, 10)
+            a = self.rng.randint(2, 8)
+            b = self.rng.randint(1, 10)
             eq = f"Simplify: {a}(x + {b})"
             ans = f"{a}x + {a * b}"
         elif difficulty == 2:
-            a = random.randint(2, 8)
-            b = random.randint(1, 10)
-            c = random.randint(1, 10)
+            a = self.rng.randint(2, 8)
+            b = self.rng.randint(1, 10)
             eq = f"Simplify: {a}(x - {b})"
             ans = f"{a}x - {a * b}"
         else:
-            a = random.randint(-8, 8)
+            a = self.rng.randint(-8, 8)
             if a == 0:
-                a = random.randint(2, 8)
-            b = random.randint(1, 10)
-            c = random.randint(1, 10)
+                a = self.rng.randint(2, 8)
+            b = self.rng.randint(1, 10)
+            c = self.rng.randint(1, 10)
             eq = f"Simplify: {a}({b}x + {c})"
             ans = f"{a * b}x + {a * c}"
 
@@ -301,23 +503,23 @@ class EquationGenerator:
     def generate_combine_like_terms(self, difficulty):
         """Combining like terms"""
         if difficulty <= 1:
-            a = random.randint(1, 10)
-            b = random.randint(1, 10)
-            c = random.randint(1, 10)
+            a = self.rng.randint(1, 10)
+            b = self.rng.randint(1, 10)
+            c = self.rng.randint(1, 10)
             eq = f"Simplify: {a}x + {b}x + {c}"
             ans = f"{a + b}x + {c}"
         elif difficulty == 2:
-            a = random.randint(1, 10)
-            b = random.randint(1, 10)
-            c = random.randint(1, 10)
-            d = random.randint(1, 10)
+            a = self.rng.randint(1, 10)
+            b = self.rng.randint(1, 10)
+            c = self.rng.randint(1, 10)
+            d = self.rng.randint(1, 10)
             eq = f"Simplify: {a}x + {b} + {c}x - {d}"
             ans = f"{a + c}x + {b - d}"
         else:
-            a = random.randint(-10, 10)
-            b = random.randint(-10, 10)
-            c = random.randint(-10, 10)
-            d = random.randint(-10, 10)
+            a = self.rng.randint(-10, 10)
+            b = self.rng.randint(-10, 10)
+            c = self.rng.randint(-10, 10)
+            d = self.rng.randint(-10, 10)
             eq = f"Simplify: {a}x² + {b}x + {c}x² - {d}x"
             ans = f"{a + c}x² + {b - d}x"
 
@@ -328,18 +530,18 @@ class EquationGenerator:
     def generate_one_step_addition(self, difficulty):
         """One-step equations with addition/subtraction"""
         if difficulty <= 1:
-            solution = random.randint(1, 20)
-            b = random.randint(1, 20)
+            solution = self.rng.randint(1, 20)
+            b = self.rng.randint(1, 20)
             eq = f"x + {b} = {solution + b}"
             ans = solution
         elif difficulty == 2:
-            solution = random.randint(-20, 20)
-            b = random.randint(1, 20)
+            solution = self.rng.randint(-20, 20)
+            b = self.rng.randint(1, 20)
             eq = f"x - {b} = {solution - b}"
             ans = solution
         else:
-            solution = random.randint(-30, 30)
-            b = random.randint(-30, 30)
+            solution = self.rng.randint(-30, 30)
+            b = self.rng.randint(-30, 30)
             eq = f"x + {b} = {solution + b}"
             ans = solution
 
@@ -348,20 +550,20 @@ class EquationGenerator:
     def generate_one_step_multiplication(self, difficulty):
         """One-step equations with multiplication/division"""
         if difficulty <= 1:
-            solution = random.randint(1, 15)
-            a = random.randint(2, 10)
+            solution = self.rng.randint(1, 15)
+            a = self.rng.randint(2, 10)
             eq = f"{a}x = {a * solution}"
             ans = solution
         elif difficulty == 2:
-            solution = random.randint(-15, 15)
-            a = random.randint(2, 10)
+            solution = self.rng.randint(-15, 15)
+            a = self.rng.randint(2, 10)
             eq = f"{a}x = {a * solution}"
             ans = solution
         else:
-            solution = random.randint(-20, 20)
-            a = random.randint(-10, 10)
+            solution = self.rng.randint(-20, 20)
+            a = self.rng.randint(-10, 10)
             if a == 0:
-                a = random.randint(2, 10)
+                a = self.rng.randint(2, 10)
             eq = f"{a}x = {a * solution}"
             ans = solution
 
@@ -370,23 +572,23 @@ class EquationGenerator:
     def generate_two_step_equation(self, difficulty):
         """Two-step equations"""
         if difficulty <= 1:
-            solution = random.randint(1, 15)
-            a = random.randint(2, 8)
-            b = random.randint(1, 15)
+            solution = self.rng.randint(1, 15)
+            a = self.rng.randint(2, 8)
+            b = self.rng.randint(1, 15)
             eq = f"{a}x + {b} = {a * solution + b}"
             ans = solution
         elif difficulty == 2:
-            solution = random.randint(-15, 15)
-            a = random.randint(2, 8)
-            b = random.randint(-15, 15)
+            solution = self.rng.randint(-15, 15)
+            a = self.rng.randint(2, 8)
+            b = self.rng.randint(-15, 15)
             eq = f"{a}x - {b} = {a * solution - b}"
             ans = solution
         else:
-            solution = random.randint(-20, 20)
-            a = random.randint(-10, 10)
+            solution = self.rng.randint(-20, 20)
+            a = self.rng.randint(-10, 10)
             if a == 0:
-                a = random.randint(2, 8)
-            b = random.randint(-20, 20)
+                a = self.rng.randint(2, 8)
+            b = self.rng.randint(-20, 20)
             eq = f"{a}x + {b} = {a * solution + b}"
             ans = solution
 
@@ -395,30 +597,30 @@ class EquationGenerator:
     def generate_variables_both_sides(self, difficulty):
         """Equations with variables on both sides"""
         if difficulty <= 1:
-            solution = random.randint(1, 15)
-            a = random.randint(2, 8)
-            b = random.randint(1, 8)
-            c = random.randint(1, 15)
+            solution = self.rng.randint(1, 15)
+            a = self.rng.randint(2, 8)
+            b = self.rng.randint(1, 8)
+            c = self.rng.randint(1, 15)
             # ax + c = bx + d, where a > b
             if a <= b:
                 a, b = b + 1, a
-            d = b * solution + c - a * solution
+            d = (b - a) * solution + c
             eq = f"{a}x + {c} = {b}x + {d}"
             ans = solution
         elif difficulty == 2:
-            solution = random.randint(-15, 15)
-            a = random.randint(3, 10)
-            b = random.randint(1, 5)
-            c = random.randint(-15, 15)
-            d = b * solution + c - a * solution
+            solution = self.rng.randint(-15, 15)
+            a = self.rng.randint(3, 10)
+            b = self.rng.randint(1, 5)
+            c = self.rng.randint(-15, 15)
+            d = (b - a) * solution + c
             eq = f"{a}x + {c} = {b}x + {d}"
             ans = solution
         else:
-            solution = random.randint(-20, 20)
-            a = random.randint(2, 12)
-            b = random.randint(1, 8)
-            c = random.randint(-25, 25)
-            d = b * solution + c - a * solution
+            solution = self.rng.randint(-20, 20)
+            a = self.rng.randint(2, 12)
+            b = self.rng.randint(1, 8)
+            c = self.rng.randint(-25, 25)
+            d = (b - a) * solution + c
             eq = f"{a}x - {c} = {b}x - {d}"
             ans = solution
 
@@ -427,33 +629,34 @@ class EquationGenerator:
     def generate_distributive_equation(self, difficulty):
         """Equations requiring distribution"""
         if difficulty <= 1:
-            solution = random.randint(1, 12)
-            a = random.randint(2, 6)
-            b = random.randint(1, 10)
-            result = a * solution - a * b
+            solution = self.rng.randint(1, 12)
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(1, 10)
+            result = a * (solution - b)
             eq = f"{a}(x - {b}) = {result}"
             ans = solution
         elif difficulty == 2:
-            solution = random.randint(-12, 12)
-            a = random.randint(2, 6)
-            b = random.randint(1, 10)
-            c = random.randint(1, 10)
-            result = a * solution + a * b + c
+            solution = self.rng.randint(-12, 12)
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(1, 10)
+            c = self.rng.randint(1, 10)
+            result = a * (solution + b) + c
             eq = f"{a}(x + {b}) + {c} = {result}"
             ans = solution
         else:
-            solution = random.randint(-15, 15)
-            a = random.randint(2, 6)
-            b = random.randint(1, 10)
-            c = random.randint(2, 6)
-            d = random.randint(1, 10)
+            solution = self.rng.randint(-15, 15)
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(1, 10)
+            c = self.rng.randint(2, 6)
+            d = self.rng.randint(1, 10)
             # a(x + b) = c(x - d)
-            result = c * solution - c * d
-            left_result = a * solution + a * b
+            cd = c * d
+            result = c * solution - cd
+            left_result = a * (solution + b)
             if left_result == result:
-                eq = f"{a}(x + {b}) = {c}x - {c * d}"
+                eq = f"{a}(x + {b}) = {c}x - {cd}"
             else:
-                eq = f"{a}(x - {b}) = {a * solution - a * b}"
+                eq = f"{a}(x - {b}) = {a * (solution - b)}"
             ans = solution
 
         return eq, f"x = {ans}"
@@ -461,25 +664,25 @@ class EquationGenerator:
     def generate_fraction_equation(self, difficulty):
         """Equations with fractions"""
         if difficulty <= 1:
-            solution = random.randint(2, 20)
-            den = random.choice([2, 3, 4, 5])
+            solution = self.rng.randint(2, 20)
+            den = self.rng.choice(_SMALL_DENOMINATORS)
             # Make sure solution * den works nicely
-            b = random.randint(1, 15)
+            b = self.rng.randint(1, 15)
             eq = f"x/{den} + {b} = {solution // den + b}"
             ans = solution
         elif difficulty == 2:
-            solution = random.randint(-20, 20)
-            num = random.randint(2, 8)
-            den = random.choice([2, 3, 4, 5])
-            b = random.randint(1, 15)
+            solution = self.rng.randint(-20, 20)
+            num = self.rng.randint(2, 8)
+            den = self.rng.choice(_SMALL_DENOMINATORS)
+            b = self.rng.randint(1, 15)
             result = (num * solution) // den + b
             eq = f"{num}x/{den} + {b} = {result}"
             ans = solution
         else:
-            solution = random.randint(-15, 15)
-            num = random.randint(2, 6)
-            den = random.choice([2, 3, 4])
-            b = random.randint(-10, 10)
+            solution = self.rng.randint(-15, 15)
+            num = self.rng.randint(2, 6)
+            den = self.rng.choice(_SMALLER_DENOMINATORS)
+            b = self.rng.randint(-10, 10)
             result = (num * solution) // den - b
             eq = f"{num}x/{den} - {b} = {result}"
             ans = solution
@@ -491,22 +694,22 @@ class EquationGenerator:
     def generate_ratio(self, difficulty):
         """Ratio problems"""
         if difficulty <= 1:
-            a = random.randint(1, 12)
-            b = random.randint(1, 12)
+            a = self.rng.randint(1, 12)
+            b = self.rng.randint(1, 12)
             eq = f"Simplify ratio {a * 2}:{b * 2}"
-            g = self.gcd(a * 2, b * 2)
+            g = math.gcd(a * 2, b * 2)
             ans = f"{(a * 2) // g}:{(b * 2) // g}"
         elif difficulty == 2:
-            a = random.randint(1, 20)
-            b = random.randint(1, 20)
-            c = random.randint(1, 20)
+            a = self.rng.randint(1, 20)
+            b = self.rng.randint(1, 20)
+            c = self.rng.randint(1, 20)
             eq = f"Simplify ratio {a}:{b}:{c}"
-            g = self.gcd(self.gcd(a, b), c)
+            g = math.gcd(a, b, c)
             ans = f"{a // g}:{b // g}:{c // g}"
         else:
             # Unit rate
-            distance = random.randint(100, 500)
-            time = random.choice([2, 4, 5, 10])
+            distance = self.rng.randint(100, 500)
+            time = self.rng.choice(_TRAVEL_HOURS)
             eq = f"Find unit rate: {distance} miles in {time} hours"
             ans = f"{distance // time} mph"
 
@@ -515,23 +718,23 @@ class EquationGenerator:
     def generate_proportion(self, difficulty):
         """Solve proportions"""
         if difficulty <= 1:
-            a = random.randint(2, 12)
-            b = random.randint(2, 12)
-            solution = random.randint(2, 20)
+            a = self.rng.randint(2, 12)
+            b = self.rng.randint(2, 12)
+            solution = self.rng.randint(2, 20)
             c = a * solution // b
             eq = f"{a}/{b} = x/{c}"
             ans = solution
         elif difficulty == 2:
-            a = random.randint(2, 15)
-            b = random.randint(2, 15)
-            solution = random.randint(3, 25)
+            a = self.rng.randint(2, 15)
+            b = self.rng.randint(2, 15)
+            solution = self.rng.randint(3, 25)
             c = (a * solution) // b
             eq = f"x/{a} = {c}/{b}"
             ans = solution
         else:
-            a = random.randint(2, 20)
-            b = random.randint(2, 20)
-            c = random.randint(2, 20)
+            a = self.rng.randint(2, 20)
+            b = self.rng.randint(2, 20)
+            c = self.rng.randint(2, 20)
             solution = (b * c) // a
             eq = f"{a}/{b} = {c}/x"
             ans = solution
@@ -541,19 +744,20 @@ class EquationGenerator:
     def generate_percent(self, difficulty):
         """Percentage problems"""
         if difficulty <= 1:
-            percent = random.choice([10, 20, 25, 50, 75])
-            of_value = random.randint(20, 200)
+            percent = self.rng.choice(_FRIENDLY_PERCENTS)
+            of_value = self.rng.randint(20, 200)
             eq = f"Find {percent}% of {of_value}"
             ans = (percent * of_value) // 100
         elif difficulty == 2:
-            percent = random.randint(5, 95)
-            of_value = random.randint(50, 500)
+            percent = self.rng.randint(5, 95)
+            of_value = self.rng.randint(50, 500)
             eq = f"What is {percent}% of {of_value}?"
-            ans = round((percent * of_value) / 100, 2)
+            # percent × value is the answer in hundredths
+            ans = _format_cents(percent * of_value)
         else:
             # Percent of change
-            original = random.randint(50, 200)
-            change = random.randint(10, 50)
+            original = self.rng.randint(50, 200)
+            change = self.rng.randint(10, 50)
             new_value = original + change
             eq = f"Find percent increase from {original} to {new_value}"
             ans = f"{round((change / original) * 100, 1)}%"
@@ -562,9 +766,9 @@ class EquationGenerator:
 
     def generate_simple_interest(self, difficulty):
         """Simple interest problems"""
-        principal = random.randint(100, 5000)
-        rate = random.choice([2, 3, 4, 5, 6, 7, 8])
-        time = random.randint(1, 10)
+        principal = self.rng.randint(100, 5000)
+        rate = self.rng.choice(_INTEREST_RATES)
+        time = self.rng.randint(1, 10)
 
         if difficulty <= 1:
             eq = f"I = Prt. Find I when P = ${principal}, r = {rate}%, t = {time} years"
@@ -587,21 +791,21 @@ class EquationGenerator:
     def generate_exponent_basic(self, difficulty):
         """Basic exponent evaluation"""
         if difficulty <= 1:
-            base = random.randint(2, 10)
-            exp = random.randint(2, 4)
+            base = self.rng.randint(2, 10)
+            exp = self.rng.randint(2, 4)
             eq = f"{base}^{exp}"
             ans = base ** exp
         elif difficulty == 2:
-            base = random.randint(-5, 5)
+            base = self.rng.randint(-5, 5)
             if base == 0:
-                base = random.randint(2, 8)
-            exp = random.randint(2, 3)
+                base = self.rng.randint(2, 8)
+            exp = self.rng.randint(2, 3)
             eq = f"({base})^{exp}"
             ans = base ** exp
         else:
-            base = random.randint(2, 8)
-            exp1 = random.randint(2, 3)
-            exp2 = random.randint(2, 3)
+            base = self.rng.randint(2, 8)
+            exp1 = self.rng.randint(2, 3)
+            exp2 = self.rng.randint(2, 3)
             eq = f"{base}^{exp1} × {base}^{exp2}"
             ans = base ** (exp1 + exp2)
 
@@ -609,22 +813,20 @@ class EquationGenerator:
 
     def generate_exponent_properties(self, difficulty):
         """Exponent properties"""
-        base = random.randint(2, 10)
-
         if difficulty <= 1:
-            exp1 = random.randint(3, 8)
-            exp2 = random.randint(2, 5)
+            exp1 = self.rng.randint(3, 8)
+            exp2 = self.rng.randint(2, 5)
             if exp1 <= exp2:
                 exp1, exp2 = exp2 + 1, exp1
             eq = f"Simplify: x^{exp1} ÷ x^{exp2}"
             ans = f"x^{exp1 - exp2}"
         elif difficulty == 2:
-            exp1 = random.randint(2, 5)
-            exp2 = random.randint(2, 4)
+            exp1 = self.rng.randint(2, 5)
+            exp2 = self.rng.randint(2, 4)
             eq = f"Simplify: (x^{exp1})^{exp2}"
             ans = f"x^{exp1 * exp2}"
         else:
-            exp = random.randint(2, 6)
+            exp = self.rng.randint(2, 6)
             eq = f"Simplify: (xy)^{exp}"
             ans = f"x^{exp}y^{exp}"
 
@@ -632,17 +834,17 @@ class EquationGenerator:
 
     def generate_negative_exponents(self, difficulty):
         """Negative and zero exponents"""
-        base = random.randint(2, 10)
+        base = self.rng.randint(2, 10)
 
         if difficulty <= 1:
             eq = f"{base}^0"
             ans = "1"
         elif difficulty == 2:
-            exp = random.randint(1, 4)
+            exp = self.rng.randint(1, 4)
             eq = f"{base}^(-{exp})"
             ans = f"1/{base**exp}"
         else:
-            exp = random.randint(2, 4)
+            exp = self.rng.randint(2, 4)
             eq = f"Simplify: x^(-{exp})"
             ans = f"1/x^{exp}"
 
@@ -651,22 +853,23 @@ class EquationGenerator:
     def generate_scientific_notation(self, difficulty):
         """Scientific notation"""
         if difficulty <= 1:
-            coef = round(random.uniform(1, 9.9), 1)
-            exp = random.randint(1, 6)
-            eq = f"Write in standard form: {coef} × 10^{exp}"
-            ans = str(int(coef * (10 ** exp)))
+            # Coefficient drawn in tenths so the answer is an exact integer
+            tenths = self.rng.randint(10, 99)
+            exp = self.rng.randint(1, 6)
+            eq = f"Write in standard form: {tenths // 10}.{tenths % 10} × 10^{exp}"
+            ans = str(tenths * _POW10[exp - 1])
         elif difficulty == 2:
-            num = random.randint(1000, 999999)
+            num = self.rng.randint(1000, 999999)
             eq = f"Write in scientific notation: {num}"
             # Count digits
             digits = len(str(num))
-            coef = num / (10 ** (digits - 1))
+            coef = num / _POW10[digits - 1]
             ans = f"{coef} × 10^{digits - 1}"
         else:
-            coef1 = round(random.uniform(1, 9), 1)
-            coef2 = round(random.uniform(1, 9), 1)
-            exp1 = random.randint(2, 5)
-            exp2 = random.randint(2, 5)
+            coef1 = round(self.rng.uniform(1, 9), 1)
+            coef2 = round(self.rng.uniform(1, 9), 1)
+            exp1 = self.rng.randint(2, 5)
+            exp2 = self.rng.randint(2, 5)
             eq = f"Multiply: ({coef1} × 10^{exp1})({coef2} × 10^{exp2})"
             result_coef = coef1 * coef2
             result_exp = exp1 + exp2
@@ -681,8 +884,8 @@ class EquationGenerator:
 
     def generate_coordinate_plane(self, difficulty):
         """Coordinate plane problems"""
-        x = random.randint(-10, 10)
-        y = random.randint(-10, 10)
+        x = self.rng.randint(-10, 10)
+        y = self.rng.randint(-10, 10)
 
         if difficulty <= 1:
             eq = f"What quadrant contains ({x}, {y})?"
@@ -697,11 +900,11 @@ class EquationGenerator:
             else:
                 ans = "On an axis"
         elif difficulty == 2:
-            x2 = random.randint(-10, 10)
+            x2 = self.rng.randint(-10, 10)
             eq = f"Find distance between ({x}, 0) and ({x2}, 0)"
             ans = abs(x - x2)
         else:
-            y2 = random.randint(-10, 10)
+            y2 = self.rng.randint(-10, 10)
             eq = f"Find midpoint of ({x}, {y}) and ({x}, {y2})"
             ans = f"({x}, {(y + y2) / 2})"
 
@@ -710,27 +913,23 @@ class EquationGenerator:
     def generate_slope(self, difficulty):
         """Slope calculations"""
         if difficulty <= 1:
-            x1, y1 = random.randint(-5, 5), random.randint(-5, 5)
-            m = random.randint(1, 5)
-            run = random.randint(1, 4)
+            x1, y1 = self.rng.randint(-5, 5), self.rng.randint(-5, 5)
+            m = self.rng.randint(1, 5)
+            run = self.rng.randint(1, 4)
             x2 = x1 + run
             y2 = y1 + m * run
             eq = f"Find slope between ({x1}, {y1}) and ({x2}, {y2})"
             ans = m
         elif difficulty == 2:
-            x1, y1 = random.randint(-10, 10), random.randint(-10, 10)
-            x2, y2 = random.randint(-10, 10), random.randint(-10, 10)
+            x1, y1 = self.rng.randint(-10, 10), self.rng.randint(-10, 10)
+            x2, y2 = self.rng.randint(-10, 10), self.rng.randint(-10, 10)
             if x2 == x1:
-                x2 += random.randint(1, 5)
+                x2 += self.rng.randint(1, 5)
             eq = f"Find slope: ({x1}, {y1}) and ({x2}, {y2})"
-            slope = (y2 - y1) / (x2 - x1)
-            if slope == int(slope):
-                ans = int(slope)
-            else:
-                ans = f"{y2 - y1}/{x2 - x1}"
+            ans = self.format_fraction(y2 - y1, x2 - x1)
         else:
-            m = random.randint(-5, 5)
-            b = random.randint(-10, 10)
+            m = self.rng.randint(-5, 5)
+            b = self.rng.randint(-10, 10)
             eq = f"Find slope of y = {m}x + {b}"
             ans = m
 
@@ -738,25 +937,26 @@ class EquationGenerator:
 
     def generate_linear_equation(self, difficulty):
         """Linear equations in slope-intercept form"""
-        m = random.randint(-5, 5)
-        b = random.randint(-10, 10)
-
         if difficulty <= 1:
-            x = random.randint(1, 10)
+            m = self.rng.randint(-5, 5)
+            b = self.rng.randint(-10, 10)
+            x = self.rng.randint(1, 10)
             eq = f"Find y when x = {x} in y = {m}x + {b}"
             ans = m * x + b
         elif difficulty == 2:
-            y = random.randint(-20, 20)
+            m = self.rng.randint(-5, 5)
+            b = self.rng.randint(-10, 10)
+            y = self.rng.randint(-20, 20)
             # mx + b = y, solve for x
             if m == 0:
-                m = random.randint(1, 5)
+                m = self.rng.randint(1, 5)
             x = (y - b) // m
             actual_y = m * x + b
             eq = f"Find x when y = {actual_y} in y = {m}x + {b}"
             ans = x
         else:
-            x1, y1 = random.randint(-5, 5), random.randint(-5, 5)
-            m = random.randint(1, 5)
+            x1, y1 = self.rng.randint(-5, 5), self.rng.randint(-5, 5)
+            m = self.rng.randint(1, 5)
             b = y1 - m * x1
             eq = f"Write equation: slope = {m}, passes through ({x1}, {y1})"
             ans = f"y = {m}x + {b}"
@@ -768,16 +968,16 @@ class EquationGenerator:
     def generate_angle_relationships(self, difficulty):
         """Angle relationships"""
         if difficulty <= 1:
-            angle = random.randint(10, 80)
+            angle = self.rng.randint(10, 80)
             eq = f"Find complement of {angle}°"
             ans = f"{90 - angle}°"
         elif difficulty == 2:
-            angle = random.randint(10, 170)
+            angle = self.rng.randint(10, 170)
             eq = f"Find supplement of {angle}°"
             ans = f"{180 - angle}°"
         else:
             # Vertical angles
-            angle = random.randint(30, 150)
+            angle = self.rng.randint(30, 150)
             eq = f"If two vertical angles are equal and one is {angle}°, find the other"
             ans = f"{angle}°"
 
@@ -786,17 +986,17 @@ class EquationGenerator:
     def generate_perimeter_area(self, difficulty):
         """Perimeter and area"""
         if difficulty <= 1:
-            length = random.randint(5, 20)
-            width = random.randint(3, 15)
+            length = self.rng.randint(5, 20)
+            width = self.rng.randint(3, 15)
             eq = f"Find area of rectangle: length = {length}, width = {width}"
             ans = length * width
         elif difficulty == 2:
-            side = random.randint(5, 20)
+            side = self.rng.randint(5, 20)
             eq = f"Find perimeter of square with side {side}"
             ans = 4 * side
         else:
-            base = random.randint(5, 20)
-            height = random.randint(4, 15)
+            base = self.rng.randint(5, 20)
+            height = self.rng.randint(4, 15)
             eq = f"Find area of triangle: base = {base}, height = {height}"
             ans = (base * height) / 2
 
@@ -804,7 +1004,7 @@ class EquationGenerator:
 
     def generate_circle_problems(self, difficulty):
         """Circle circumference and area"""
-        radius = random.randint(3, 15)
+        radius = self.rng.randint(3, 15)
 
         if difficulty <= 1:
             eq = f"Find circumference: radius = {radius} (use π ≈ 3.14)"
@@ -821,39 +1021,23 @@ class EquationGenerator:
 
     def generate_pythagorean(self, difficulty):
         """Pythagorean theorem"""
-        # Use Pythagorean triples for cleaner answers
-        triples = [(3, 4, 5), (5, 12, 13), (8, 15, 17), (7, 24, 25)]
-
-        if difficulty <= 1:
-            a, b, c = random.choice(triples[:2])
-            eq = f"Find c: a = {a}, b = {b} (a² + b² = c²)"
-            ans = c
-        elif difficulty == 2:
-            a, b, c = random.choice(triples)
-            eq = f"Find hypotenuse: legs are {a} and {b}"
-            ans = c
-        else:
-            a, b, c = random.choice(triples)
-            eq = f"Find leg: hypotenuse = {c}, other leg = {a}"
-            ans = b
-
-        return eq, str(ans)
+        return self.rng.choice(_PYTHAGOREAN_PROBLEMS[min(max(difficulty, 1), 3)])
 
     def generate_volume(self, difficulty):
         """Volume problems"""
         if difficulty <= 1:
-            l = random.randint(3, 10)
-            w = random.randint(3, 10)
-            h = random.randint(3, 10)
+            l = self.rng.randint(3, 10)
+            w = self.rng.randint(3, 10)
+            h = self.rng.randint(3, 10)
             eq = f"Find volume of rectangular prism: l={l}, w={w}, h={h}"
             ans = l * w * h
         elif difficulty == 2:
-            r = random.randint(2, 8)
-            h = random.randint(5, 15)
+            r = self.rng.randint(2, 8)
+            h = self.rng.randint(5, 15)
             eq = f"Find volume of cylinder: r={r}, h={h} (V=πr²h, π≈3.14)"
             ans = round(3.14 * r**2 * h, 2)
         else:
-            s = random.randint(3, 12)
+            s = self.rng.randint(3, 12)
             eq = f"Find volume of cube: side = {s}"
             ans = s ** 3
 
@@ -864,15 +1048,16 @@ class EquationGenerator:
     def generate_mean_median(self, difficulty):
         """Mean, median, mode"""
         if difficulty <= 1:
-            data = [random.randint(1, 20) for _ in range(5)]
+            data = self.rng.choices(range(1, 21), k=5)
             eq = f"Find mean: {data}"
             ans = sum(data) / len(data)
         elif difficulty == 2:
-            data = sorted([random.randint(1, 30) for _ in range(7)])
+            data = self.rng.choices(range(1, 31), k=7)
+            data.sort()
             eq = f"Find median: {data}"
             ans = data[len(data) // 2]
         else:
-            data = [random.randint(1, 50) for _ in range(10)]
+            data = self.rng.choices(range(1, 51), k=10)
             eq = f"Find range: {data}"
             ans = max(data) - min(data)
 
@@ -881,8 +1066,8 @@ class EquationGenerator:
     def generate_probability(self, difficulty):
         """Probability problems"""
         if difficulty <= 1:
-            favorable = random.randint(1, 5)
-            total = random.randint(favorable + 1, 12)
+            favorable = self.rng.randint(1, 5)
+            total = self.rng.randint(favorable + 1, 12)
             eq = f"Probability: {favorable} favorable outcomes out of {total} total"
             ans = self.format_fraction(favorable, total)
         elif difficulty == 2:
@@ -891,7 +1076,7 @@ class EquationGenerator:
             ans = "1/2"
         else:
             # Dice
-            outcomes = random.randint(1, 6)
+            outcomes = self.rng.randint(1, 6)
             eq = f"Probability of rolling ≤ {outcomes} on standard die"
             ans = self.format_fraction(outcomes, 6)
 
@@ -899,290 +1084,152 @@ class EquationGenerator:
 
     # ===== MAIN GENERATION LOGIC =====
 
+    def iter_equations(self, count=10000):
+        """Yield (equation, answer) pairs one at a time following the progression stages"""
+        for stage in STAGES:
+            start, end = stage['range']
+            if start >= count:
+                break
+
+            # Flatten to (generator, difficulty) pairs, each weighted so that
+            # every generator stays equally likely whatever its list length
+            pool = []
+            weights = []
+            for kind, difficulties in stage['generators']:
+                generator = getattr(self, f"generate_{kind}")
+                for difficulty in difficulties:
+                    pool.append((generator, difficulty))
+                    weights.append(1 / len(difficulties))
+
+            # Randomly select a generator and difficulty for every equation in the stage at once
+            picks = self.rng.choices(pool, cum_weights=list(accumulate(weights)),
+                                     k=min(end, count) - start)
+
+            for generator, difficulty in picks:
+                yield generator(difficulty)
+
     def generate_equation_set(self, count=10000):
         """Generate a complete set of progressively challenging equations"""
+        count = min(count, STAGES[-1]['range'][1])
+        self.equations = [None] * count
+        self.answers = [None] * count
 
-        # Define progression stages
-        stages = [
-            # Stage 1: Basic arithmetic (equations 1-1000)
-            {
-                'range': (0, 500),
-                'generators': [
-                    (self.generate_addition_subtraction, [1, 1, 2]),
-                    (self.generate_multiplication_division, [1, 1, 2]),
-                    (self.generate_pemdas, [1, 1, 1]),
-                    (self.generate_absolute_value, [1, 1, 1]),
-                ]
-            },
-            # Stage 2: More arithmetic + square roots (equations 501-1200)
-            {
-                'range': (500, 1200),
-                'generators': [
-                    (self.generate_addition_subtraction, [2, 3, 3]),
-                    (self.generate_multiplication_division, [2, 3, 3]),
-                    (self.generate_pemdas, [2, 2, 2]),
-                    (self.generate_square_roots, [1, 1, 2]),
-                ]
-            },
-            # Stage 3: Fractions introduction (equations 1201-2000)
-            {
-                'range': (1200, 2000),
-                'generators': [
-                    (self.generate_pemdas, [3, 3, 3]),
-                    (self.generate_square_roots, [2, 2, 3]),
-                    (self.generate_fraction_addition, [1, 1, 1]),
-                    (self.generate_fraction_multiplication, [1, 1, 1]),
-                    (self.generate_decimal_operations, [1, 1, 2]),
-                ]
-            },
-            # Stage 4: Advanced fractions + decimals (equations 2001-3000)
-            {
-                'range': (2000, 3000),
-                'generators': [
-                    (self.generate_fraction_addition, [2, 2, 3]),
-                    (self.generate_fraction_multiplication, [2, 2, 3]),
-                    (self.generate_decimal_operations, [2, 3, 3]),
-                ]
-            },
-            # Stage 5: Expressions and evaluation (equations 3001-4000)
-            {
-                'range': (3000, 4000),
-                'generators': [
-                    (self.generate_evaluate_expression, [1, 1, 2]),
-                    (self.generate_distributive_property, [1, 1, 2]),
-                    (self.generate_combine_like_terms, [1, 1, 2]),
-                ]
-            },
-            # Stage 6: Advanced expressions (equations 4001-4800)
-            {
-                'range': (4000, 4800),
-                'generators': [
-                    (self.generate_evaluate_expression, [2, 2, 3]),
-                    (self.generate_distributive_property, [2, 2, 3]),
-                    (self.generate_combine_like_terms, [2, 2, 3]),
-                ]
-            },
-            # Stage 7: One-step equations (equations 4801-5600)
-            {
-                'range': (4800, 5600),
-                'generators': [
-                    (self.generate_one_step_addition, [1, 2, 2]),
-                    (self.generate_one_step_multiplication, [1, 2, 2]),
-                ]
-            },
-            # Stage 8: Two-step equations (equations 5601-6500)
-            {
-                'range': (5600, 6500),
-                'generators': [
-                    (self.generate_one_step_addition, [3, 3, 3]),
-                    (self.generate_one_step_multiplication, [3, 3, 3]),
-                    (self.generate_two_step_equation, [1, 1, 2]),
-                ]
-            },
-            # Stage 9: Variables on both sides (equations 6501-7200)
-            {
-                'range': (6500, 7200),
-                'generators': [
-                    (self.generate_two_step_equation, [2, 3, 3]),
-                    (self.generate_variables_both_sides, [1, 1, 2]),
-                ]
-            },
-            # Stage 10: Distribution in equations (equations 7201-7800)
-            {
-                'range': (7200, 7800),
-                'generators': [
-                    (self.generate_variables_both_sides, [2, 2, 3]),
-                    (self.generate_distributive_equation, [1, 2, 2]),
-                    (self.generate_fraction_equation, [1, 1, 1]),
-                ]
-            },
-            # Stage 11: Ratios and proportions (equations 7801-8400)
-            {
-                'range': (7800, 8400),
-                'generators': [
-                    (self.generate_distributive_equation, [3, 3, 3]),
-                    (self.generate_fraction_equation, [2, 2, 3]),
-                    (self.generate_ratio, [1, 2, 2]),
-                    (self.generate_proportion, [1, 2, 2]),
-                    (self.generate_percent, [1, 2, 2]),
-                ]
-            },
-            # Stage 12: Exponents (equations 8401-9000)
-            {
-                'range': (8400, 9000),
-                'generators': [
-                    (self.generate_simple_interest, [1, 2, 3]),
-                    (self.generate_exponent_basic, [1, 2, 3]),
-                    (self.generate_exponent_properties, [1, 2, 2]),
-                    (self.generate_negative_exponents, [1, 2, 3]),
-                    (self.generate_scientific_notation, [1, 1, 2]),
-                ]
-            },
-            # Stage 13: Linear functions (equations 9001-9500)
-            {
-                'range': (9000, 9500),
-                'generators': [
-                    (self.generate_scientific_notation, [2, 3, 3]),
-                    (self.generate_coordinate_plane, [1, 2, 3]),
-                    (self.generate_slope, [1, 2, 3]),
-                    (self.generate_linear_equation, [1, 2, 3]),
-                ]
-            },
-            # Stage 14: Geometry (equations 9501-9800)
-            {
-                'range': (9500, 9800),
-                'generators': [
-                    (self.generate_angle_relationships, [1, 2, 3]),
-                    (self.generate_perimeter_area, [1, 2, 3]),
-                    (self.generate_circle_problems, [1, 2, 3]),
-                    (self.generate_pythagorean, [1, 2, 3]),
-                    (self.generate_volume, [1, 2, 3]),
-                ]
-            },
-            # Stage 15: Final mixed review (equations 9801-10000)
-            {
-                'range': (9800, 10000),
-                'generators': [
-                    (self.generate_mean_median, [1, 2, 3]),
-                    (self.generate_probability, [1, 2, 3]),
-                    (self.generate_variables_both_sides, [3, 3, 3]),
-                    (self.generate_distributive_equation, [3, 3, 3]),
-                    (self.generate_linear_equation, [3, 3, 3]),
-                    (self.generate_pythagorean, [3, 3, 3]),
-                ]
-            },
-        ]
+        # Items are stored unnumbered; numbers are added when writing output
+        for i, (eq, ans) in enumerate(self.iter_equations(count)):
+            self.equations[i] = eq
+            self.answers[i] = ans
 
-        equation_num = 1
+        return self.equations, self.answers
 
-        for stage in stages:
-            start, end = stage['range']
-            generators = stage['generators']
-
-            while equation_num <= end and equation_num <= count:
-                # Randomly select a generator
-                generator, difficulties = random.choice(generators)
-                difficulty = random.choice(difficulties)
-
-                try:
-                    eq, ans = generator(difficulty)
-                    self.equations.append(f"{equation_num}. {eq}")
-                    self.answers.append(f"{equation_num}. {ans}")
-                    equation_num += 1
-                except Exception as e:
-                    # If generation fails, try again
-                    continue
 
-        return self.equations, self.answers
+def _validate_generators():
+    """Run every staged generator at each of its difficulties so a broken one fails fast"""
+    generator = EquationGenerator(seed=0)
+    for stage in STAGES:
+        for kind, difficulties in stage['generators']:
+            for difficulty in sorted(set(difficulties)):
+                getattr(generator, f"generate_{kind}")(difficulty)
+
+
+# PDF page layout (points)
+_PAGE_WIDTH, _PAGE_HEIGHT = letter
+_TOP_Y = _PAGE_HEIGHT - 1*inch
+_BOTTOM_Y = 0.75*inch
+_CONTENT_WIDTH = _PAGE_WIDTH - 1.5*inch
+
+# Rows are 6.5" wide, centered, with one 28pt band per text line
+_ROW_WIDTH = 6.5*inch
+_ROW_X = (_PAGE_WIDTH - _ROW_WIDTH) / 2
+_ROW_PADDING = 12
+_ROW_HEIGHT = 28
+_ROW_BASELINE = 7
+_ROW_FONT_SIZE = 24
+
+# PDF colors
+_TITLE_COLOR = colors.HexColor('#1a5490')
+_SUBTITLE_COLOR = colors.HexColor('#666666')
+_ANSWER_COLOR = colors.HexColor('#2c5282')
+_ROW_COLORS = (colors.white, colors.HexColor('#f7fafc'))
+
+
+def _draw_centered(c, text, font, size, leading, color, y):
+    """Draw text centered and wrapped to the page content width; return the y below it"""
+    c.setFont(font, size)
+    c.setFillColor(color)
+    for line in simpleSplit(text, font, size, _CONTENT_WIDTH):
+        y -= leading
+        c.drawCentredString(_PAGE_WIDTH / 2, y, line)
+    return y
+
+
+def _draw_rows(c, rows, font, text_color):
+    """Draw one page of (number, y, height, lines) rows
+
+    Stripes are grouped by fill color and all text goes through a single text
+    object, so colors and the font are set once per page rather than per row.
+    """
+    c.setLineWidth(0.5)
+    c.setStrokeColor(colors.grey)
+    for parity, fill in enumerate(_ROW_COLORS):
+        c.setFillColor(fill)
+        for number, y, height, lines in rows:
+            if (number - 1) % 2 == parity:
+                c.rect(_ROW_X, y, _ROW_WIDTH, height, stroke=1, fill=1)
+
+    text = c.beginText()
+    text.setFont(font, _ROW_FONT_SIZE)
+    text.setFillColor(text_color)
+    x = _ROW_X + _ROW_PADDING
+    for number, y, height, lines in rows:
+        for k, line in enumerate(lines, 1):
+            text.setTextOrigin(x, y + height - k * _ROW_HEIGHT + _ROW_BASELINE)
+            text.textOut(line)
+    c.drawText(text)
 
 
 def create_pdf(filename, title, content_list, is_answers=False):
     """Create a stylish PDF with equations or answers"""
-    doc = SimpleDocTemplate(
-        filename,
-        pagesize=letter,
-        rightMargin=0.75*inch,
-        leftMargin=0.75*inch,
-        topMargin=1*inch,
-        bottomMargin=0.75*inch
-    )
-
-    # Container for the 'Flowable' objects
-    elements = []
-
-    # Define styles
-    styles = getSampleStyleSheet()
-
-    # Custom title style
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=48,
-        textColor=colors.HexColor('#1a5490'),
-        spaceAfter=30,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
-
-    # Custom subtitle style
-    subtitle_style = ParagraphStyle(
-        'CustomSubtitle',
-        parent=styles['Normal'],
-        fontSize=32,
-        textColor=colors.HexColor('#666666'),
-        spaceAfter=20,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Oblique'
-    )
-
-    # Custom equation style
-    equation_style = ParagraphStyle(
-        'EquationStyle',
-        parent=styles['Normal'],
-        fontSize=24,
-        textColor=colors.black,
-        leftIndent=0,
-        fontName='Helvetica',
-        leading=16
-    )
-
-    # Answer style (slightly different color)
-    answer_style = ParagraphStyle(
-        'AnswerStyle',
-        parent=styles['Normal'],
-        fontSize=24,
-        textColor=colors.HexColor('#2c5282') if is_answers else colors.black,
-        leftIndent=0,
-        fontName='Helvetica-Bold' if is_answers else 'Helvetica',
-        leading=16
-    )
+    c = canvas.Canvas(filename, pagesize=letter)
+
+    # Use answer style for answer PDFs
+    font = 'Helvetica-Bold' if is_answers else 'Helvetica'
+    text_color = _ANSWER_COLOR if is_answers else colors.black
+    text_width = _ROW_WIDTH - 2 * _ROW_PADDING
 
     # Add title
-    elements.append(Paragraph(title, title_style))
+    y = _draw_centered(c, title, 'Helvetica-Bold', 48, 54, _TITLE_COLOR, _TOP_Y)
 
     # Add generation date
     date_str = datetime.now().strftime("%B %d, %Y at %I:%M %p")
-    elements.append(Paragraph(f"Generated on {date_str}", subtitle_style))
-
-    # Add horizontal line
-    elements.append(Spacer(1, 0.2*inch))
-
-    # Add content in organized sections
-    items_per_page = 50
-
-    for i in range(0, len(content_list), items_per_page):
-        section = content_list[i:i+items_per_page]
-
-        # Create table data
-        table_data = []
-        for item in section:
-            # Use answer style for answer PDFs
-            style = answer_style if is_answers else equation_style
-            table_data.append([Paragraph(item, style)])
+    y = _draw_centered(c, f"Generated on {date_str}", 'Helvetica-Oblique', 32, 38,
+                       _SUBTITLE_COLOR, y - 30)
+    y -= 20 + 0.2*inch
+
+    # Lay rows out a page at a time, then draw each finished page in one pass
+    rows = []
+    for number, item in enumerate(content_list, 1):
+        text = f"{number}. {item}"
+        # Most rows fit on one line; only measure word by word when they don't
+        if stringWidth(text, font, _ROW_FONT_SIZE) <= text_width:
+            lines = (text,)
+        else:
+            lines = simpleSplit(text, font, _ROW_FONT_SIZE, text_width)
+        height = len(lines) * _ROW_HEIGHT
 
-        # Create table
-        t = Table(table_data, colWidths=[6.5*inch])
-        t.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.white),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 12),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 12),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('ROWBACKGROUNDS', (0, 0), (-1, -1), [colors.white, colors.HexColor('#f7fafc')]),
-        ]))
+        if y - height < _BOTTOM_Y:
+            _draw_rows(c, rows, font, text_color)
+            c.showPage()
+            rows.clear()
+            y = _TOP_Y
+        y -= height
+        rows.append((number, y, height, lines))
 
-        elements.append(t)
+    _draw_rows(c, rows, font, text_color)
+    c.save()
 
-        # Add page break if not last section
-        if i + items_per_page < len(content_list):
-            elements.append(PageBreak())
 
-    # Build PDF
-    doc.build(elements)
+# √ followed by digits
+_SQRT_PATTERN = re.compile(r'√(\d+)')
 
 
 def convert_to_programming_friendly(text):
@@ -1194,9 +1241,7 @@ def convert_to_programming_friendly(text):
     text = text.replace('÷', '/')
 
     # Handle square roots - convert √n to sqrt(n)
-    import re
-    # Match √ followed by digits
-    text = re.sub(r'√(\d+)', r'sqrt(\1)', text)
+    text = _SQRT_PATTERN.sub(r'sqrt(\1)', text)
 
     # Handle exponents
     # Replace ² with **2
@@ -1210,6 +1255,15 @@ def convert_to_programming_friendly(text):
     return text
 
 
+def create_txt(filename, content_list):
+    """Create a TXT file with programming-friendly operators, one item per line"""
+    lines = [f"# {convert_to_programming_friendly(item)}\n" for item in content_list]
+
+    # Write the whole file in one call
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write(''.join(lines))
+
+
 def main():
     """Main function to generate equations and create PDFs"""
     print("=" * 70)
@@ -1219,6 +1273,7 @@ def main():
 
     # Generate equations
     print("Generating 10,000 progressively challenging equations...")
+    _validate_generators()
     generator = EquationGenerator()
     equations, answers = generator.generate_equation_set(10000)
 
@@ -1233,23 +1288,30 @@ def main():
 
     print("Creating stylish PDF files...")
 
-    # Create equations PDF
-    create_pdf(
-        equations_filename,
-        "10,000 Pre-Algebra Practice Equations",
-        equations,
-        is_answers=False
-    )
-    print(f"✓ Created: {equations_filename}")
-
-    # Create answers PDF
-    create_pdf(
-        answers_filename,
-        "Answer Key - 10,000 Pre-Algebra Equations",
-        answers,
-        is_answers=True
-    )
-    print(f"✓ Created: {answers_filename}")
+    # The two PDFs are independent, so build them in separate processes
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        # Create equations PDF
+        equations_pdf = pool.submit(
+            create_pdf,
+            equations_filename,
+            "10,000 Pre-Algebra Practice Equations",
+            equations,
+            is_answers=False
+        )
+
+        # Create answers PDF
+        answers_pdf = pool.submit(
+            create_pdf,
+            answers_filename,
+            "Answer Key - 10,000 Pre-Algebra Equations",
+            answers,
+            is_answers=True
+        )
+
+        equations_pdf.result()
+        print(f"✓ Created: {equations_filename}")
+        answers_pdf.result()
+        print(f"✓ Created: {answers_filename}")
 
     # Create TXT files with programming-friendly operators
     equations_txt_filename = f"equations_{timestamp}.txt"
@@ -1258,37 +1320,11 @@ def main():
     print("\nCreating TXT files with programming-friendly operators...")
 
     # Create equations TXT file
-    with open(equations_txt_filename, 'w', encoding='utf-8') as f:
-        for eq in equations:
-            # Replace line number with '#'
-            # Extract the equation part after the number
-            parts = eq.split('. ', 1)
-            if len(parts) == 2:
-                eq_text = parts[1]
-                # Convert to programming-friendly format
-                eq_friendly = convert_to_programming_friendly(eq_text)
-                f.write(f"# {eq_friendly}\n")
-            else:
-                # Fallback if format is different
-                eq_friendly = convert_to_programming_friendly(eq)
-                f.write(f"# {eq_friendly}\n")
+    create_txt(equations_txt_filename, equations)
     print(f"✓ Created: {equations_txt_filename}")
 
     # Create answers TXT file
-    with open(answers_txt_filename, 'w', encoding='utf-8') as f:
-        for ans in answers:
-            # Replace line number with '#'
-            # Extract the answer part after the number
-            parts = ans.split('. ', 1)
-            if len(parts) == 2:
-                ans_text = parts[1]
-                # Convert to programming-friendly format
-                ans_friendly = convert_to_programming_friendly(ans_text)
-                f.write(f"# {ans_friendly}\n")
-            else:
-                # Fallback if format is different
-                ans_friendly = convert_to_programming_friendly(ans)
-                f.write(f"# {ans_friendly}\n")
+    create_txt(answers_txt_filename, answers)
     print(f"✓ Created: {answers_txt_filename}")
 
     print()